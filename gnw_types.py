@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Proposal:
     source: str
     content: Dict[str, Any]
@@ -21,6 +22,10 @@ class Proposal:
             self.sources = [self.source]
 
 
+# Shared empty result for modules with nothing to propose (avoids a new list per cycle)
+NO_PROPOSALS: Tuple[Proposal, ...] = ()
+
+
 @dataclass
 class WorkspaceContent:
     type: str
@@ -34,15 +39,17 @@ class WorkspaceContent:
 @dataclass
 class WorkspaceState:
     current: Optional[WorkspaceContent] = None
-    history: List[WorkspaceContent] = field(default_factory=list)
+    history: Deque[WorkspaceContent] = field(default_factory=deque)
 
 
 class Module(ABC):
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
 
     @abstractmethod
-    def produce_proposals(self, context: Dict[str, Any]) -> List[Proposal]:
+    def produce_proposals(self, context: Dict[str, Any]) -> Sequence[Proposal]:
         raise NotImplementedError
 
     def on_broadcast(self, content: WorkspaceContent, context: Dict[str, Any]) -> None:
@@ -269,18 +269,18 @@ class HizawyeAI:
         gain = 1.0 + (total_curiosity - total_pain) / 200.0
         return max(0.6, min(1.4, gain))
 
-    def _compute_exploration_allowed(self):
+    def _compute_exploration_allowed(self, drives=None):
         """Gate exploration when goal focus is strong."""
-        drives = self.emotions.compute_drive_vector()
+        drives = drives or self.emotions.compute_drive_vector()
         focus_drive = drives['focus'] / 100.0
         boredom = self.emotions.get_total_boredom()
         if self.goals['active_goals'] and focus_drive > 0.6 and boredom < 60:
             return False
         return True
 
-    def _compute_perception_scale(self):
+    def _compute_perception_scale(self, drives=None):
         """Scale perceptual salience when focus is strong."""
-        drives = self.emotions.compute_drive_vector()
+        drives = drives or self.emotions.compute_drive_vector()
         focus_drive = drives['focus'] / 100.0
         if self.goals['active_goals'] and focus_drive > 0.7:
             return 0.6
@@ -368,13 +368,13 @@ class HizawyeAI:
             return []
         items = []
         if isinstance(raw, list):
-            def flatten(lst):
-                for el in lst:
-                    if isinstance(el, list):
-                        flatten(el)
-                    else:
-                        items.append(el)
-            flatten(raw)
+            stack = [raw]
+            while stack:
+                el = stack.pop()
+                if isinstance(el, list):
+                    stack.extend(reversed(el))
+                else:
+                    items.append(el)
         return items
 
     def _goal_exists_for_concept(self, concept):
@@ -435,14 +435,18 @@ class HizawyeAI:
             # Convert legacy goals to new format if needed
             self._migrate_legacy_goals()
 
+            # Drives are fixed for the cycle; modules reuse them from the context
+            drives = self.emotions.compute_drive_vector()
+
             # Update workspace context
             self.workspace.update_context(
                 active_goals=self.goals['active_goals'],
                 current_focus=self.current_focus,
                 cycle=cycle_count,
                 attention_gain=self._compute_attention_gain(),
-                exploration_allowed=self._compute_exploration_allowed(),
-                perception_scale=self._compute_perception_scale(),
+                drives=drives,
+                exploration_allowed=self._compute_exploration_allowed(drives),
+                perception_scale=self._compute_perception_scale(drives),
                 recent_explores=list(self.recent_explores),
                 recent_actions=list(self.recent_actions),
             )
@@ -676,15 +680,14 @@ class HizawyeAI:
             return True
 
         # Check if concept needs understanding
-        if target_concept in self.memory.graph:
-            node_data = self.memory.graph.nodes[target_concept]
-            if not node_data.get('description'):
-                # Create goal to understand it
-                if not self._goal_exists_for_concept(target_concept):
-                    new_goal = self.planner.create_goal_for_concept(target_concept)
-                    self.goals['active_goals'].insert(0, new_goal)
-                    print(f"📌 Created goal to understand '{target_concept}'")
-                    return True
+        node_data = self.memory.graph.nodes[target_concept]
+        if not node_data.get('description'):
+            # Create goal to understand it
+            if not self._goal_exists_for_concept(target_concept):
+                new_goal = self.planner.create_goal_for_concept(target_concept)
+                self.goals['active_goals'].insert(0, new_goal)
+                print(f"📌 Created goal to understand '{target_concept}'")
+                return True
 
         return False
 
@@ -697,10 +700,10 @@ class HizawyeAI:
         self.current_focus = concept
         print(f"👁️ Perceived concept: '{concept}'")
 
-        if not self.memory.graph.has_node(concept):
+        node_data = self.memory.graph.nodes.get(concept)
+        if node_data is None:
             self.memory.add_node(concept)
-
-        node_data = self.memory.graph.nodes[concept]
+            node_data = self.memory.graph.nodes[concept]
         if not node_data.get("description"):
             if not self._goal_exists_for_concept(concept):
                 new_goal = self.planner.create_goal_for_concept(concept)
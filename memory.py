@@ -2,7 +2,8 @@ import networkx as nx
 import json
 import os
 import random
-import math
+import heapq
+from operator import itemgetter
 from datetime import datetime, timezone
 # --- NEW: Force a non-interactive backend for matplotlib ---
 # This must be done BEFORE importing pyplot
@@ -10,8 +11,14 @@ import matplotlib
 matplotlib.use('Agg')
 # --- END NEW ---
 import matplotlib.pyplot as plt
+import numpy as np
 from log import setup_logger
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
 # Initialize the logger
 logger = setup_logger()
 
@@ -24,23 +31,53 @@ class MemoryGraph:
         self.attention_scores = {}  # Node importance scores
         self.working_memory = []    # Hot cache of active concepts (7±2 limit)
         self.working_memory_capacity = 7
+        self.understood_nodes = set()   # Nodes that have a description
+        self._version = 0               # Bumped on every graph mutation
+        self._last_saved_version = -1
+        self._load_mtime = None
+        self._node_features_cache = {}  # node -> (neighbors, relationships, degree)
+        self._node_features_version = -1
+        self._attention_cache_key = None
+        self._node_list = []
+        self._node_list_version = -1
+        self._fig_main = None           # Reused matplotlib figures for visualize()
+        self._fig_overview = None
 
     def add_node(self, node_name, attributes=None):
         """Adds a concept/node to the memory."""
         self.graph.add_node(node_name, **(attributes or {}))
+        self._update_understood(node_name)
+        self._version += 1
         logger.info(f"Node '{node_name}' added to memory graph.")
 
     def add_description_to_node(self, node_name, description):
         """Adds or updates the description attribute of a node."""
         if self.graph.has_node(node_name):
             self.graph.nodes[node_name]['description'] = description
+            self._update_understood(node_name)
+            self._version += 1
             logger.info(f"Description for node '{node_name}' has been updated.")
         else:
             logger.warning(f"Attempted to add description to non-existent node '{node_name}'.")
 
+    def _update_understood(self, node_name):
+        """Keep understood_nodes in sync with a node's description."""
+        if self.graph.nodes[node_name].get('description'):
+            self.understood_nodes.add(node_name)
+        else:
+            self.understood_nodes.discard(node_name)
+
+    def _rebuild_understood(self):
+        """Recompute understood_nodes from scratch (after load or clear)."""
+        self.understood_nodes = {
+            node for node, data in self.graph.nodes(data=True)
+            if data.get('description')
+        }
+
     def add_connection(self, node1, node2, relationship="is_related_to"):
         """Connects two concepts."""
-        now = datetime.now(timezone.utc).isoformat()
+        now_dt = datetime.now(timezone.utc)
+        now = now_dt.isoformat()
         if self.graph.has_edge(node1, node2):
             edge_data = self.graph.get_edge_data(node1, node2) or {}
             weight = int(edge_data.get("weight", 1)) + 1
@@ -54,12 +91,26 @@ class MemoryGraph:
             node2,
             label=label,
             weight=weight,
-            last_updated=now
+            last_updated=now,
+            last_updated_ts=now_dt.timestamp()
         )
+        self._version += 1
         logger.info(
             f"Connection created between '{node1}' and '{node2}' with relationship '{label}'."
         )
 
+    @property
+    def graph_version(self):
+        """Counter bumped on every graph mutation, for callers that cache graph-derived data."""
+        return self._version
+
+    def _nodes_list(self):
+        """Get a list of all nodes, rebuilt only when the graph version changes."""
+        if self._node_list_version != self._version:
+            self._node_list = list(self.graph.nodes())
+            self._node_list_version = self._version
+        return self._node_list
+
     def find_connected_nodes(self, node_name):
         """Finds all nodes connected to a given node."""
         if node_name in self.graph:
@@ -76,11 +127,17 @@ class MemoryGraph:
         if not self.graph.nodes():
             return {}
 
+        # Scores only change with the graph, focus, or working memory contents
+        cache_key = (current_focus, recency_weight, self._version, tuple(self.working_memory))
+        if cache_key == self._attention_cache_key:
+            return self.attention_scores
+
         # Base scores from PageRank (structural importance)
         try:
             pagerank_scores = nx.pagerank(self.graph, alpha=0.85)
         except:
-            pagerank_scores = {node: 1.0 / len(self.graph.nodes()) for node in self.graph.nodes()}
+            nodes = self._nodes_list()
+            pagerank_scores = {node: 1.0 / len(nodes) for node in nodes}
 
         # Spreading activation from current focus
         activation_scores = {}
@@ -88,15 +145,18 @@ class MemoryGraph:
             # Current focus gets max activation
             activation_scores[current_focus] = 1.0
 
+            # Iterate the adjacency dicts directly rather than via .neighbors()
+            adj = self.graph._adj
+
             # 1-hop neighbors get moderate activation
-            for neighbor in self.graph.neighbors(current_focus):
+            for neighbor in adj[current_focus]:
                 activation_scores[neighbor] = 0.6
 
             # 2-hop neighbors get lower activation
             try:
                 two_hop = set()
-                for neighbor in self.graph.neighbors(current_focus):
-                    for second_neighbor in self.graph.neighbors(neighbor):
+                for neighbor in adj[current_focus]:
+                    for second_neighbor in adj[neighbor]:
                         if second_neighbor != current_focus:
                             two_hop.add(second_neighbor)
                 for node in two_hop:
@@ -120,6 +180,7 @@ class MemoryGraph:
             )
 
         self.attention_scores = combined_scores
+        self._attention_cache_key = cache_key
         logger.info(f"Computed attention scores for {len(combined_scores)} nodes")
         return combined_scores
 
@@ -144,11 +205,12 @@ class MemoryGraph:
             context_parts.append(f"'{concept}' is not yet understood.")
 
         # 1-hop neighbors with relationships
-        neighbors = list(self.graph.neighbors(concept))
+        concept_edges = self.graph._adj[concept]
+        neighbors = list(concept_edges)
         if neighbors:
             neighbor_info = []
             for neighbor in neighbors[:5]:  # Limit to top 5
-                edge_data = self.graph.get_edge_data(concept, neighbor)
+                edge_data = concept_edges[neighbor]
                 relationship = edge_data.get('label', 'is_related_to') if edge_data else 'is_related_to'
 
                 neighbor_node_data = self.graph.nodes[neighbor]
@@ -196,6 +258,26 @@ class MemoryGraph:
 
         return " | ".join(context_parts)
 
+    def _node_features(self, node):
+        """
+        Get cached (neighbors, relationships, degree) for a node.
+        The cache is rebuilt lazily whenever the graph version changes.
+        """
+        if self._node_features_version != self._version:
+            self._node_features_cache = {}
+            self._node_features_version = self._version
+
+        features = self._node_features_cache.get(node)
+        if features is None:
+            edges = self.graph._adj[node]
+            neighbors = set(edges)
+            relationships = {
+                data.get('label', 'is_related_to') for data in edges.values() if data
+            }
+            features = (neighbors, relationships, self.graph.degree(node))
+            self._node_features_cache[node] = features
+        return features
+
     def find_analogies(self, concept_a, concept_b):
         """
         Find structural similarities between two concepts.
@@ -204,37 +286,29 @@ class MemoryGraph:
         if not (self.graph.has_node(concept_a) and self.graph.has_node(concept_b)):
             return 0.0, []
 
+        neighbors_a, relationships_a, degree_a = self._node_features(concept_a)
+        neighbors_b, relationships_b, degree_b = self._node_features(concept_b)
+
         # Shared neighbors (concepts connected to both)
-        neighbors_a = set(self.graph.neighbors(concept_a))
-        neighbors_b = set(self.graph.neighbors(concept_b))
         shared = neighbors_a & neighbors_b
 
         # Structural similarity: compare degree, clustering
-        degree_a = self.graph.degree(concept_a)
-        degree_b = self.graph.degree(concept_b)
         degree_similarity = 1.0 - abs(degree_a - degree_b) / max(degree_a, degree_b, 1)
 
         # Relationship pattern similarity
-        relationships_a = set()
-        relationships_b = set()
-
-        for neighbor in neighbors_a:
-            edge_data = self.graph.get_edge_data(concept_a, neighbor)
-            if edge_data:
-                relationships_a.add(edge_data.get('label', 'is_related_to'))
-
-        for neighbor in neighbors_b:
-            edge_data = self.graph.get_edge_data(concept_b, neighbor)
-            if edge_data:
-                relationships_b.add(edge_data.get('label', 'is_related_to'))
-
         shared_relationships = relationships_a & relationships_b
 
+        # Union sizes via inclusion-exclusion (avoids building union sets)
+        union_neighbors = len(neighbors_a) + len(neighbors_b) - len(shared)
+        union_relationships = (
+            len(relationships_a) + len(relationships_b) - len(shared_relationships)
+        )
+
         # Compute analogy score
         analogy_score = (
-            len(shared) / max(len(neighbors_a | neighbors_b), 1) * 0.5 +
+            len(shared) / max(union_neighbors, 1) * 0.5 +
             degree_similarity * 0.3 +
-            len(shared_relationships) / max(len(relationships_a | relationships_b), 1) * 0.2
+            len(shared_relationships) / max(union_relationships, 1) * 0.2
         )
 
         patterns = {
@@ -272,73 +346,86 @@ class MemoryGraph:
         """
         if not current_focus or current_focus not in self.graph:
             # Random selection if no focus
-            if self.graph.nodes():
-                return random.choice(list(self.graph.nodes()))
-            return None
+            nodes = self._nodes_list()
+            return random.choice(nodes) if nodes else None
 
         # Update attention scores based on current focus
         self.compute_attention_scores(current_focus)
 
         # Get candidates (connected concepts)
-        candidates = list(self.graph.neighbors(current_focus))
+        candidates = list(self.graph._adj[current_focus])
 
         if not candidates:
             # Dead end: pick highest attention score globally
-            sorted_nodes = sorted(
-                self.attention_scores.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
-            for node, score in sorted_nodes:
-                if not avoid_recent or node not in self.working_memory:
-                    return node
-            return sorted_nodes[0][0] if sorted_nodes else None
+            if not self.attention_scores:
+                return None
+            scored = self.attention_scores.items()
+            if avoid_recent:
+                fresh = [item for item in scored if item[0] not in self.working_memory]
+                scored = fresh or scored
+            return max(scored, key=itemgetter(1))[0]
 
         # Filter out recently explored if requested
         if avoid_recent:
-            candidates = [c for c in candidates if c not in self.working_memory[:3]]
+            recent = set(self.working_memory[:3])
+            candidates = [c for c in candidates if c not in recent]
 
         if not candidates:
-            candidates = list(self.graph.neighbors(current_focus))
-
-        # Score candidates by attention
-        candidate_scores = {
-            c: self.attention_scores.get(c, 0.0) for c in candidates
-        }
+            candidates = list(self.graph._adj[current_focus])
 
-        # Weight by understanding status (prefer ununderstood)
-        for candidate in candidates:
-            node_data = self.graph.nodes[candidate]
-            if not node_data.get('description'):
-                candidate_scores[candidate] *= 1.5  # Boost unknown concepts
+        # Score candidates by attention, weighted by understanding status
+        def candidate_score(candidate):
+            score = self.attention_scores.get(candidate, 0.0)
+            if not self.graph.nodes[candidate].get('description'):
+                return score * 1.5  # Boost unknown concepts
+            return score
 
         # Select highest scoring candidate
-        if candidate_scores:
-            best_candidate = max(candidate_scores.items(), key=lambda x: x[1])[0]
-            return best_candidate
-
-        return random.choice(candidates) if candidates else None
+        return max(candidates, key=candidate_score)
 
     def save_to_json(self):
         """Saves the graph to its designated file inside the mind directory."""
+        # Skip re-serializing a graph that hasn't changed since the last save
+        if self._version == self._last_saved_version and os.path.exists(self.filepath):
+            return
         os.makedirs(self.mind_directory, exist_ok=True)
         data = nx.node_link_data(self.graph, edges='links')
-        with open(self.filepath, 'w') as f:
-            json.dump(data, f, indent=4)
+        if orjson is not None:
+            with open(self.filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.filepath, 'w') as f:
+                json.dump(data, f, indent=4)
+        self._last_saved_version = self._version
         # We log the save action from hizawye_ai.py which has more context
 
     def load_from_json(self):
         """Loads the graph from its designated file."""
         try:
-            with open(self.filepath, 'r') as f:
-                data = json.load(f)
+            mtime = os.path.getmtime(self.filepath)
+            # Skip the rebuild if the file and in-memory graph are unchanged since last load
+            if mtime == self._load_mtime and self._version == self._last_saved_version:
+                return
+            if orjson is not None:
+                with open(self.filepath, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.filepath, 'r') as f:
+                    data = json.load(f)
             self.graph = nx.node_link_graph(data, edges='links')
+            self._rebuild_understood()
+            self._version += 1
+            self._last_saved_version = self._version
+            self._load_mtime = mtime
             logger.info(f"Memory graph loaded successfully from {self.filepath}")
         except (FileNotFoundError, json.JSONDecodeError):
             logger.warning("No valid memory file found. The graph will be empty.")
             self.graph.clear()
-            
-    def visualize(self, current_focus=None, label_top_k=12, overview_top_k=20):
+            self._rebuild_understood()
+            self._version += 1
+            self._load_mtime = None
+
+    def visualize(self, current_focus=None, label_top_k=12, overview_top_k=20, hi_res=False):
         """Creates a visual representation of the memory graph and saves it to a file."""
         if not self.graph.nodes():
             print("Cannot visualize an empty graph.")
@@ -347,25 +434,27 @@ class MemoryGraph:
         print("Generating memory visualization...")
 
         attention_scores = self.compute_attention_scores(current_focus=current_focus)
-        scores = list(attention_scores.values()) if attention_scores else [0.0]
-        min_score = min(scores)
-        max_score = max(scores)
+        nodes = self._nodes_list()
+        scores = np.fromiter(
+            (attention_scores.get(node, 0.0) for node in nodes),
+            dtype=np.float64,
+            count=len(nodes)
+        )
+        min_score = min(attention_scores.values()) if attention_scores else 0.0
+        max_score = max(attention_scores.values()) if attention_scores else 0.0
         score_range = max(max_score - min_score, 1e-6)
-
-        def scale_score(score, min_size=1200, max_size=5200):
-            normalized = (score - min_score) / score_range
-            return min_size + normalized * (max_size - min_size)
+        min_size, max_size = 1200, 5200
 
         known_nodes = {
             node for node, data in self.graph.nodes(data=True)
             if data.get('description')
         }
 
-        top_nodes = sorted(
+        top_nodes = heapq.nlargest(
+            max(3, min(label_top_k, len(self.graph.nodes()))),
             attention_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:max(3, min(label_top_k, len(self.graph.nodes())))]
+            key=itemgetter(1)
+        )
         top_set = {node for node, _ in top_nodes}
 
         colors = {
@@ -374,28 +463,24 @@ class MemoryGraph:
             "top": "#1976D2",
         }
 
-        node_sizes = []
-        node_colors = []
-        node_edgecolors = []
-        node_edgewidths = []
-        for node in self.graph.nodes():
-            score = attention_scores.get(node, 0.0)
-            size = scale_score(score)
-            if node in top_set:
-                size *= 1.25
-                node_colors.append(colors["top"])
-            elif node in known_nodes:
-                node_colors.append(colors["known"])
-            else:
-                node_colors.append(colors["unknown"])
-            node_sizes.append(size)
+        is_top = np.fromiter((node in top_set for node in nodes), dtype=bool, count=len(nodes))
+        is_known = np.fromiter((node in known_nodes for node in nodes), dtype=bool, count=len(nodes))
+        is_focus = np.fromiter(
+            (bool(current_focus) and node == current_focus for node in nodes),
+            dtype=bool,
+            count=len(nodes)
+        )
 
-            if current_focus and node == current_focus:
-                node_edgecolors.append("#FFD54F")
-                node_edgewidths.append(3.0)
-            else:
-                node_edgecolors.append("#263238")
-                node_edgewidths.append(1.5)
+        node_sizes = min_size + (scores - min_score) / score_range * (max_size - min_size)
+        node_sizes[is_top] *= 1.25
+        node_colors = np.where(
+            is_top,
+            colors["top"],
+            np.where(is_known, colors["known"], colors["unknown"])
+        ).tolist()
+        node_edgecolors = np.where(is_focus, "#FFD54F", "#263238").tolist()
+        node_edgewidths = np.where(is_focus, 3.0, 1.5).tolist()
+        node_sizes = node_sizes.tolist()
 
         if len(self.graph.nodes()) <= 30:
             label_nodes = set(self.graph.nodes())
@@ -407,12 +492,17 @@ class MemoryGraph:
 
         labels = {node: node for node in label_nodes}
 
-        plt.figure(figsize=(20, 16))
+        if self._fig_main is None:
+            self._fig_main = plt.figure(figsize=(20, 16))
+        else:
+            self._fig_main.clf()
+        ax = self._fig_main.add_subplot()
         pos = nx.spring_layout(self.graph, k=0.9, iterations=80, seed=7)
 
         nx.draw_networkx_nodes(
             self.graph,
             pos,
+            ax=ax,
             node_color=node_colors,
             node_size=node_sizes,
             edgecolors=node_edgecolors,
@@ -422,6 +512,7 @@ class MemoryGraph:
         nx.draw_networkx_edges(
             self.graph,
             pos,
+            ax=ax,
             edge_color="#90A4AE",
             width=edge_widths,
             alpha=0.8
@@ -429,6 +520,7 @@ class MemoryGraph:
         nx.draw_networkx_labels(
             self.graph,
             pos,
+            ax=ax,
             labels=labels,
             font_size=11,
             font_weight="bold"
@@ -442,6 +534,7 @@ class MemoryGraph:
         nx.draw_networkx_edge_labels(
             self.graph,
             pos,
+            ax=ax,
             edge_labels=edge_labels,
             font_color="#C62828",
             font_size=9
@@ -455,45 +548,59 @@ class MemoryGraph:
         ]
         if current_focus:
             legend_items.append(Patch(facecolor="#FFD54F", edgecolor="#263238", label="Current focus"))
-        plt.legend(handles=legend_items, loc="upper right", frameon=True)
+        ax.legend(handles=legend_items, loc="upper right", frameon=True)
 
-        plt.title("Hizawye's Memory Map", size=24)
-        plt.axis("off")
+        ax.set_title("Hizawye's Memory Map", size=24)
+        ax.axis("off")
 
+        dpi = 300 if hi_res else 150
         output_path = os.path.join(self.mind_directory, "memory_map.png")
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._fig_main.savefig(output_path, dpi=dpi, bbox_inches='tight')
+        self._fig_main.clf()
         print(f"✅ Memory map saved as an image to: {output_path}")
 
         if overview_top_k and len(self.graph.nodes()) > 0:
             top_k = min(overview_top_k, len(self.graph.nodes()))
-            self._save_overview_map(attention_scores, top_k, current_focus)
+            self._save_overview_map(attention_scores, top_k, current_focus, dpi=dpi)
 
     def _edge_widths(self, graph):
-        widths = []
-        for _, _, data in graph.edges(data=True):
-            weight = max(1, int(data.get("weight", 1)))
-            width = 1.0 + min(4.0, math.log1p(weight))
+        edge_data = [data for _, _, data in graph.edges(data=True)]
+        weights = np.fromiter(
+            (max(1, int(data.get("weight", 1))) for data in edge_data),
+            dtype=np.float64,
+            count=len(edge_data)
+        )
+        widths = 1.0 + np.minimum(4.0, np.log1p(weights))
 
-            last_updated = data.get("last_updated")
-            if last_updated:
-                try:
-                    updated = datetime.fromisoformat(last_updated)
-                    age_days = (datetime.now(timezone.utc) - updated).days
-                    recency_factor = max(0.5, 1.0 - (age_days / 30.0))
-                    width *= recency_factor
-                except ValueError:
-                    pass
+        now_ts = datetime.now(timezone.utc).timestamp()
+        for idx, data in enumerate(edge_data):
+            updated_ts = self._edge_timestamp(data)
+            if updated_ts is not None:
+                age_days = (now_ts - updated_ts) // 86400
+                widths[idx] *= max(0.5, 1.0 - (age_days / 30.0))
 
-            widths.append(width)
-        return widths
+        return widths.tolist()
 
-    def _save_overview_map(self, attention_scores, overview_top_k, current_focus=None):
-        top_nodes = sorted(
-            attention_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:overview_top_k]
+    def _edge_timestamp(self, data):
+        """Get an edge's last update as a unix timestamp, caching it on legacy edges."""
+        updated_ts = data.get("last_updated_ts")
+        if updated_ts is not None:
+            return updated_ts
+
+        last_updated = data.get("last_updated")
+        if not last_updated:
+            return None
+        try:
+            updated = datetime.fromisoformat(last_updated)
+        except ValueError:
+            return None
+        if updated.tzinfo is None:
+            updated = updated.replace(tzinfo=timezone.utc)
+        data["last_updated_ts"] = updated.timestamp()
+        return data["last_updated_ts"]
+
+    def _save_overview_map(self, attention_scores, overview_top_k, current_focus=None, dpi=150):
+        top_nodes = heapq.nlargest(overview_top_k, attention_scores.items(), key=itemgetter(1))
         node_set = {node for node, _ in top_nodes}
         if current_focus:
             node_set.add(current_focus)
@@ -504,7 +611,11 @@ class MemoryGraph:
             return
 
         labels = {node: node for node in subgraph.nodes()}
-        plt.figure(figsize=(14, 12))
+        if self._fig_overview is None:
+            self._fig_overview = plt.figure(figsize=(14, 12))
+        else:
+            self._fig_overview.clf()
+        ax = self._fig_overview.add_subplot()
         pos = nx.spring_layout(subgraph, k=0.8, iterations=60, seed=11)
 
         node_colors = []
@@ -524,6 +635,7 @@ class MemoryGraph:
         nx.draw_networkx_nodes(
             subgraph,
             pos,
+            ax=ax,
             node_color=node_colors,
             node_size=node_sizes,
             edgecolors=node_edgecolors,
@@ -533,6 +645,7 @@ class MemoryGraph:
         nx.draw_networkx_edges(
             subgraph,
             pos,
+            ax=ax,
             edge_color="#90A4AE",
             width=edge_widths,
             alpha=0.9
@@ -540,21 +653,24 @@ class MemoryGraph:
         nx.draw_networkx_labels(
             subgraph,
             pos,
+            ax=ax,
             labels=labels,
             font_size=10,
             font_weight="bold"
         )
 
-        plt.title("Hizawye's Memory Map (Top Attention)", size=20)
-        plt.axis("off")
+        ax.set_title("Hizawye's Memory Map (Top Attention)", size=20)
+        ax.axis("off")
         output_path = os.path.join(self.mind_directory, "memory_map_focus.png")
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._fig_overview.savefig(output_path, dpi=dpi, bbox_inches='tight')
+        self._fig_overview.clf()
         print(f"✅ Memory focus map saved as an image to: {output_path}")
 
     def create_default_mind(self):
         """Wipes the current graph and builds the standard initial mind."""
         self.graph.clear()
+        self._rebuild_understood()
+        self._version += 1
         logger.info("Creating default mind state in memory graph.")
         print("Injecting core concepts into the new mind...")
         
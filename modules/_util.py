@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+_max = max
+_min = min
+
+
+def clamp(value: float, min_value: float = 0.0, max_value: float = 1.0) -> float:
+    return _max(min_value, _min(max_value, value))
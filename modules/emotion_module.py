@@ -2,19 +2,21 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from gnw_types import Module
+from gnw_types import NO_PROPOSALS, Module
 from log import setup_logger
 
 logger = setup_logger()
 
 
 class EmotionModule(Module):
+    __slots__ = ("emotions",)
+
     def __init__(self, emotions) -> None:
         super().__init__("Emotion")
         self.emotions = emotions
 
     def produce_proposals(self, context: Dict[str, Any]):
-        return []
+        return NO_PROPOSALS
 
     def on_broadcast(self, content, context: Dict[str, Any]) -> None:
         if content.type == "percept":
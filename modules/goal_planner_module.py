@@ -1,31 +1,31 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Sequence
 
-from gnw_types import Module, Proposal
+from gnw_types import NO_PROPOSALS, Module, Proposal
+from modules._util import clamp
 from log import setup_logger
 
 logger = setup_logger()
 
 
-def _clamp(value: float, min_value: float = 0.0, max_value: float = 1.0) -> float:
-    return max(min_value, min(max_value, value))
-
-
 class GoalPlannerModule(Module):
+    __slots__ = ("planner", "emotions")
+
     def __init__(self, planner, emotions) -> None:
         super().__init__("GoalPlanner")
         self.planner = planner
         self.emotions = emotions
 
-    def produce_proposals(self, context: Dict[str, Any]) -> List[Proposal]:
+    def produce_proposals(self, context: Dict[str, Any]) -> Sequence[Proposal]:
         active_goals = context.get("active_goals", [])
         if not active_goals:
-            return []
+            return NO_PROPOSALS
 
         current_goal = active_goals[0]
+        drives = context.get("drives") or self.emotions.compute_drive_vector()
 
-        if self.planner.should_retreat(current_goal):
+        if self.planner.should_retreat(current_goal, drives=drives):
             alternative = self.planner.generate_alternative_goal(current_goal)
             logger.info(
                 f"[{self.name}] Proposing strategy switch for '{current_goal['concept']}'"
@@ -48,15 +48,14 @@ class GoalPlannerModule(Module):
                 )
             ]
 
-        drives = self.emotions.compute_drive_vector()
         confidence = self.emotions.state.get("confidence", 0.5)
         focus_drive = drives["focus"] / 100.0
 
         # Boost goal execution so it doesn't get starved by high-salience percepts.
-        evidence = _clamp(0.35 + (focus_drive * confidence))
-        salience = _clamp(0.1 + focus_drive)
+        evidence = clamp(0.35 + (focus_drive * confidence))
+        salience = clamp(0.1 + focus_drive)
         novelty = 0.2
-        urgency = _clamp(0.2 + confidence)
+        urgency = clamp(0.2 + confidence)
 
         logger.info(
             f"[{self.name}] Proposing goal execution: '{current_goal['concept']}'"
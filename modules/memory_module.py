@@ -2,19 +2,21 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from gnw_types import Module
+from gnw_types import NO_PROPOSALS, Module
 from log import setup_logger
 
 logger = setup_logger()
 
 
 class MemoryModule(Module):
+    __slots__ = ("memory",)
+
     def __init__(self, memory) -> None:
         super().__init__("Memory")
         self.memory = memory
 
     def produce_proposals(self, context: Dict[str, Any]):
-        return []
+        return NO_PROPOSALS
 
     def on_broadcast(self, content, context: Dict[str, Any]) -> None:
         concept = self._extract_concept(content)
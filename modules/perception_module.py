@@ -1,42 +1,42 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
-from gnw_types import Module, Proposal
+from gnw_types import NO_PROPOSALS, Module, Proposal
+from modules._util import clamp
 from log import setup_logger
 
 logger = setup_logger()
 
 
-def _clamp(value: float, min_value: float = 0.0, max_value: float = 1.0) -> float:
-    return max(min_value, min(max_value, value))
-
-
 class PerceptionModule(Module):
+    __slots__ = ("input_stream", "memory", "_cached_nodes", "_cached_version")
+
     def __init__(self, input_stream, memory) -> None:
         super().__init__("Perception")
         self.input_stream = input_stream
         self.memory = memory
+        self._cached_nodes = None
+        self._cached_version = -1
 
-    def produce_proposals(self, context: Dict[str, Any]) -> List[Proposal]:
-        available = list(self.memory.graph.nodes()) if self.memory.graph.nodes() else None
-        event = self.input_stream.next_event(available_concepts=available)
+    def produce_proposals(self, context: Dict[str, Any]) -> Sequence[Proposal]:
+        event = self.input_stream.next_event(available_concepts=self._available_concepts())
         if not event:
-            return []
+            return NO_PROPOSALS
 
         concept = event.payload.get("concept")
         novelty = 0.6
         if concept:
-            if concept not in self.memory.graph:
+            node_data = self.memory.graph.nodes.get(concept)
+            if node_data is None:
                 novelty = 1.0
             else:
-                node_data = self.memory.graph.nodes[concept]
                 novelty = 0.7 if not node_data.get("description") else 0.3
 
         perception_scale = context.get("perception_scale", 1.0)
-        evidence = _clamp(event.salience * perception_scale)
-        salience = _clamp(event.salience * perception_scale)
-        urgency = _clamp((0.3 + event.salience * 0.5) * perception_scale)
+        evidence = clamp(event.salience * perception_scale)
+        salience = clamp(event.salience * perception_scale)
+        urgency = clamp((0.3 + event.salience * 0.5) * perception_scale)
 
         logger.info(f"[{self.name}] Proposing percept: {event.payload}")
 
@@ -50,3 +50,10 @@ class PerceptionModule(Module):
                 urgency=urgency,
             )
         ]
+
+    def _available_concepts(self) -> Optional[List[str]]:
+        # Only rebuild the node snapshot when the graph has changed
+        if self.memory.graph_version != self._cached_version:
+            self._cached_nodes = list(self.memory.graph.nodes()) or None
+            self._cached_version = self.memory.graph_version
+        return self._cached_nodes
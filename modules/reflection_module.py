@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Sequence
 
-from gnw_types import Module, Proposal
+from gnw_types import NO_PROPOSALS, Module, Proposal
+from modules._util import clamp
 from log import setup_logger
 
 logger = setup_logger()
 
 
-def _clamp(value: float, min_value: float = 0.0, max_value: float = 1.0) -> float:
-    return max(min_value, min(max_value, value))
-
-
 class ReflectionModule(Module):
+    __slots__ = ("learner", "emotions", "reflection_interval", "cycles_since_reflection")
+
     def __init__(self, learner, emotions, reflection_interval: int = 15) -> None:
         super().__init__("Reflection")
         self.learner = learner
@@ -20,8 +19,9 @@ class ReflectionModule(Module):
         self.reflection_interval = reflection_interval
         self.cycles_since_reflection = 0
 
-    def produce_proposals(self, context: Dict[str, Any]) -> List[Proposal]:
-        self.cycles_since_reflection += 1
+    def produce_proposals(self, context: Dict[str, Any]) -> Sequence[Proposal]:
+        cycles_since_reflection = self.cycles_since_reflection + 1
+        self.cycles_since_reflection = cycles_since_reflection
 
         total_pain = self.emotions.get_total_pain()
         confusion = self.emotions.state.get("confusion", 0.0)
@@ -29,13 +29,13 @@ class ReflectionModule(Module):
         should_reflect = (
             total_pain > 70
             or confusion > 0.7
-            or self.cycles_since_reflection >= self.reflection_interval
+            or cycles_since_reflection >= self.reflection_interval
         )
 
         if not should_reflect:
-            return []
+            return NO_PROPOSALS
 
-        urgency = _clamp((total_pain + confusion * 100.0) / 200.0)
+        urgency = clamp((total_pain + confusion * 100.0) / 200.0)
         trigger = "pain" if total_pain > 70 or confusion > 0.7 else "periodic"
         cycle = context.get("cycle")
 
@@ -2,17 +2,46 @@
 Planning Engine: Intelligent goal decomposition and strategy selection.
 Replaces hardcoded goal patterns with adaptive planning.
 """
+import json
 import random
+import re
+from datetime import datetime
+import networkx as nx
 from log import setup_logger
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
 logger = setup_logger()
 
+# Phrases that mark an echoed prompt rather than a definition
+_INVALID_PHRASES = (
+    "i feel disconnected",
+    "system instruction", "your task", "your output", "define the concept",
+    "direct fulfillment", "echo instructions", "first-person realization",
+    "example:", "as a thought synthesizer", "output rules", "additional constraints"
+)
+_INVALID_PHRASES_RE = re.compile("|".join(re.escape(p) for p in _INVALID_PHRASES))
+
+_datetime_now = datetime.now
+
+# Strategy complexity codes (lower is simpler)
+_COMPLEXITY_CODES = {'simple': 0, 'moderate': 1, 'complex': 2}
+
 class PlanningEngine:
+    # select_strategy only distinguishes "> 3", so BFS can stop here
+    MAX_GRAPH_DISTANCE = 5
+
     def __init__(self, memory_graph, emotional_system, learning_tracker):
         self.memory = memory_graph
         self.emotions = emotional_system
         self.learner = learning_tracker
 
+        # Graph distance cache: concept -> (graph_version, distance)
+        self._dist_cache = {}
+
         # Strategy library with metadata
         self.strategies = {
             'direct_define': {
@@ -69,12 +98,43 @@ class PlanningEngine:
             }
         }
 
+        # Structure-of-arrays view of the strategy library, indexed by strategy id
+        self._strategy_keys = tuple(self.strategies.keys())
+        self._strategy_index = {s: i for i, s in enumerate(self._strategy_keys)}
+        self._strategy_display_names = tuple(info['name'] for info in self.strategies.values())
+        self._strategy_complexity = tuple(
+            _COMPLEXITY_CODES[info['complexity']] for info in self.strategies.values()
+        )
+        self._strategy_tasks = tuple(info['llm_task'] for info in self.strategies.values())
+
+        # Dispatch tables for execute_goal: every task builder takes just the concept
+        self._task_builders = dict(zip(self._strategy_keys, self._strategy_tasks))
+        synthesis_task = self.strategies['contextual_synthesis']['llm_task']
+        self._task_builders['contextual_synthesis'] = lambda concept: synthesis_task(
+            concept, self.memory.find_connected_nodes(concept)
+        )
+        self._result_processors = {
+            'bottom_up_composition': self._process_decomposition_result,
+            'top_down_decomposition': self._process_decomposition_result,
+        }
+
+        # Precomputed strategy groupings (avoid per-call list construction)
+        self._far_strategies = ('analogical_reasoning', 'top_down_decomposition')
+        self._simple_strategies = tuple(
+            s for s, code in zip(self._strategy_keys, self._strategy_complexity)
+            if code <= _COMPLEXITY_CODES['moderate']
+        )
+        self._alternatives = {
+            s: tuple(k for k in self._strategy_keys if k != s)
+            for s in self._strategy_keys
+        }
+
     def select_strategy(self, concept, context=None):
         """
         Intelligently select best strategy for understanding a concept.
         Considers: graph structure, emotional state, learning history, concept complexity.
         """
-        available_strategies = list(self.strategies.keys())
+        available_strategies = self._strategy_keys
 
         # Get emotional drives
         drives = self.emotions.compute_drive_vector()
@@ -83,10 +143,7 @@ class PlanningEngine:
         # Filter strategies based on emotional state
         if drives['should_simplify']:
             # High pain/confusion → prefer simpler strategies
-            available_strategies = [
-                s for s in available_strategies
-                if self.strategies[s]['complexity'] in ['simple', 'moderate']
-            ]
+            available_strategies = self._simple_strategies
             logger.info("Pain threshold high, limiting to simpler strategies")
 
         # Use learning history to recommend best strategy
@@ -107,7 +164,7 @@ class PlanningEngine:
             return 'direct_define'
         elif graph_distance > 3:
             # Far from known concepts, use analogy or decomposition
-            return random.choice(['analogical_reasoning', 'top_down_decomposition'])
+            return random.choice(self._far_strategies)
         else:
             # Close to known concepts, try contextual synthesis
             return 'contextual_synthesis'
@@ -115,31 +172,37 @@ class PlanningEngine:
     def _compute_graph_distance(self, concept):
         """
         Compute minimum distance from concept to any understood node.
-        Returns 0 if concept not in graph, otherwise min path length.
+        Returns 0 if concept not in graph, otherwise min path length
+        (capped at MAX_GRAPH_DISTANCE when no understood node is that close).
         """
         if not self.memory.graph.has_node(concept):
             return 0
 
-        # Find all understood nodes (nodes with descriptions)
-        understood_nodes = [
-            node for node, data in self.memory.graph.nodes(data=True)
-            if data.get('description')
-        ]
+        graph_version = self.memory.graph_version
+        cached = self._dist_cache.get(concept)
+        if cached and cached[0] == graph_version:
+            return cached[1]
+
+        understood_nodes = self.memory.understood_nodes
 
         if not understood_nodes:
+            self._dist_cache[concept] = (graph_version, float('inf'))
             return float('inf')
 
-        import networkx as nx
-        min_distance = float('inf')
-
-        for understood_node in understood_nodes:
-            try:
-                distance = nx.shortest_path_length(self.memory.graph, concept, understood_node)
-                min_distance = min(min_distance, distance)
-            except nx.NetworkXNoPath:
-                continue
+        # One BFS from the concept covers every understood target. It stays on
+        # the default backend: the cutoff keeps it local, while handing it to a
+        # GPU backend would copy the whole (constantly changing) graph first.
+        lengths = nx.single_source_shortest_path_length(
+            self.memory.graph, concept, cutoff=self.MAX_GRAPH_DISTANCE
+        )
+        min_distance = min(
+            (dist for node, dist in lengths.items() if node in understood_nodes),
+            default=float('inf')
+        )
 
-        return min_distance if min_distance != float('inf') else 5
+        distance = min_distance if min_distance != float('inf') else self.MAX_GRAPH_DISTANCE
+        self._dist_cache[concept] = (graph_version, distance)
+        return distance
 
     def create_goal_for_concept(self, concept, strategy=None):
         """
@@ -148,18 +211,18 @@ class PlanningEngine:
         if strategy is None:
             strategy = self.select_strategy(concept)
 
-        strategy_info = self.strategies[strategy]
+        strategy_name = self._strategy_display_names[self._strategy_index[strategy]]
 
         goal = {
             'type': 'understand_concept',
             'concept': concept,
             'strategy': strategy,
-            'strategy_name': strategy_info['name'],
+            'strategy_name': strategy_name,
             'attempts': 0,
             'created_at': self._get_timestamp()
         }
 
-        logger.info(f"Created goal: understand '{concept}' using '{strategy_info['name']}'")
+        logger.info(f"Created goal: understand '{concept}' using '{strategy_name}'")
         return goal
 
     def execute_goal(self, goal, llm_function):
@@ -169,19 +232,12 @@ class PlanningEngine:
         """
         concept = goal['concept']
         strategy = goal['strategy']
-        strategy_info = self.strategies[strategy]
 
         # Track attempt
         goal['attempts'] += 1
 
         # Generate LLM task based on strategy
-        if strategy == 'contextual_synthesis':
-            neighbors = self.memory.find_connected_nodes(concept)
-            task = strategy_info['llm_task'](concept, neighbors)
-        elif strategy in ['bottom_up_composition', 'top_down_decomposition']:
-            task = strategy_info['llm_task'](concept)
-        else:
-            task = strategy_info['llm_task'](concept)
+        task = self._task_builders[strategy](concept)
 
         # Modulate prompt based on emotional state
         task = self.emotions.modulate_llm_prompt(task, context_type='definition')
@@ -191,10 +247,8 @@ class PlanningEngine:
         llm_response = llm_function(task)
 
         # Process result based on strategy type
-        if strategy in ['bottom_up_composition', 'top_down_decomposition']:
-            return self._process_decomposition_result(concept, strategy, llm_response)
-        else:
-            return self._process_definition_result(concept, strategy, llm_response)
+        processor = self._result_processors.get(strategy, self._process_definition_result)
+        return processor(concept, strategy, llm_response)
 
     def _process_definition_result(self, concept, strategy, llm_response):
         """
@@ -205,17 +259,11 @@ class PlanningEngine:
         clean_thought = self._extract_final_thought(llm_response)
 
         # Validate definition quality
-        invalid_phrases = [
-            "system instruction", "your task", "your output", "define the concept",
-            "direct fulfillment", "echo instructions", "first-person realization",
-            "example:", "as a thought synthesizer", "output rules", "additional constraints"
-        ]
-
+        # Cheap length checks first; maxsplit bounds the word-count allocation to 4 items
         is_invalid = (
-            "i feel disconnected" in clean_thought.lower() or
-            any(phrase in clean_thought.lower() for phrase in invalid_phrases) or
             len(clean_thought) > 300 or
-            len(clean_thought.split()) < 4
+            len(clean_thought.split(maxsplit=3)) < 4 or
+            _INVALID_PHRASES_RE.search(clean_thought.lower()) is not None
         )
 
         if is_invalid:
@@ -231,28 +279,25 @@ class PlanningEngine:
         Parse and validate decomposition (JSON array) result.
         Returns: (success, result_dict, pain_delta)
         """
-        import json
-
         try:
             # Extract JSON array from response
             response = self._strip_code_fences(llm_response)
-            json_start = response.find('[')
-            json_end = response.rfind(']') + 1
-            if json_start == -1 or json_end == 0:
+            json_str = self._extract_json_array(response)
+            if json_str is None:
                 raise ValueError("No JSON array found")
 
-            json_str = response[json_start:json_end]
-            raw_concepts = json.loads(json_str)
+            raw_concepts = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
 
-            # Flatten nested arrays
+            # Flatten nested arrays (iteratively, in order)
             sub_concepts = []
-            def flatten(lst):
-                for el in lst:
-                    if isinstance(el, list):
-                        flatten(el)
-                    else:
-                        sub_concepts.append(str(el))
-            flatten(raw_concepts)
+            append = sub_concepts.append
+            stack = [raw_concepts]
+            while stack:
+                el = stack.pop()
+                if isinstance(el, list):
+                    stack.extend(reversed(el))
+                else:
+                    append(str(el))
 
             if len(sub_concepts) < 2:
                 raise ValueError("Too few sub-concepts")
@@ -273,6 +318,37 @@ class PlanningEngine:
                 return clean_thought
         return llm_response
 
+    def _extract_json_array(self, text):
+        """
+        Return the first balanced [...] substring in one forward scan,
+        ignoring brackets inside JSON strings. Returns None if there is none.
+        """
+        start = text.find('[')
+        if start == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        escaped = False
+        for idx in range(start, len(text)):
+            char = text[idx]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '[':
+                depth += 1
+            elif char == ']':
+                depth -= 1
+                if depth == 0:
+                    return text[start:idx + 1]
+        return None
+
     def _strip_code_fences(self, text):
         """Strip markdown code fences if present."""
         if "```" not in text:
@@ -284,10 +360,9 @@ class PlanningEngine:
 
     def _get_timestamp(self):
         """Get current timestamp for goal tracking."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        return _datetime_now().isoformat()
 
-    def should_retreat(self, goal):
+    def should_retreat(self, goal, drives=None):
         """
         Determine if we should abandon current strategy and try different approach.
         Based on: repeated failures, excessive pain, emotional state.
@@ -296,7 +371,7 @@ class PlanningEngine:
             logger.warning(f"Goal has {goal['attempts']} attempts, should consider retreat")
             return True
 
-        drives = self.emotions.compute_drive_vector()
+        drives = drives or self.emotions.compute_drive_vector()
         if drives['retreat'] > 70:
             logger.warning("Retreat drive is high, should change approach")
             return True
@@ -312,10 +387,7 @@ class PlanningEngine:
         failed_strategy = failed_goal['strategy']
 
         # Get all strategies except the failed one
-        alternative_strategies = [
-            s for s in self.strategies.keys()
-            if s != failed_strategy
-        ]
+        alternative_strategies = self._alternatives.get(failed_strategy, self._strategy_keys)
 
         if not alternative_strategies:
             # Fallback: create exploration goal
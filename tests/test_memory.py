@@ -1,3 +1,4 @@
+import os
 import random
 
 from memory import MemoryGraph
@@ -42,3 +43,104 @@ def test_find_exploration_target_prefers_non_recent_unknowns(tmp_path):
 
     target = mg.find_exploration_target(current_focus="a", avoid_recent=True)
     assert target == "c"
+
+
+def test_save_skips_unchanged_graph_and_round_trips(tmp_path):
+    mg = MemoryGraph(mind_directory=str(tmp_path))
+    mg.add_node("a")
+    mg.add_node("b", {"description": "known concept"})
+    mg.add_connection("a", "b", relationship="informs")
+    mg.save_to_json()
+
+    mtime = os.path.getmtime(mg.filepath)
+    os.utime(mg.filepath, (mtime - 10, mtime - 10))
+    mg.save_to_json()
+    assert os.path.getmtime(mg.filepath) == mtime - 10
+
+    loaded = MemoryGraph(mind_directory=str(tmp_path))
+    loaded.load_from_json()
+    assert loaded.graph.nodes["b"]["description"] == "known concept"
+    assert loaded.graph["a"]["b"]["label"] == "informs"
+
+    graph_before = loaded.graph
+    loaded.load_from_json()
+    assert loaded.graph is graph_before
+
+
+def test_find_analogies_reflects_graph_changes(tmp_path):
+    mg = MemoryGraph(mind_directory=str(tmp_path))
+    for node in ("a", "b", "x", "y"):
+        mg.add_node(node)
+    mg.add_connection("a", "x", relationship="uses")
+    mg.add_connection("b", "y", relationship="uses")
+
+    score_before, patterns = mg.find_analogies("a", "b")
+    assert patterns["shared_neighbors"] == []
+
+    mg.add_connection("b", "x", relationship="uses")
+    score_after, patterns = mg.find_analogies("a", "b")
+    assert patterns["shared_neighbors"] == ["x"]
+    assert score_after > score_before
+
+
+def test_attention_scores_refresh_when_graph_or_working_memory_changes(tmp_path):
+    mg = MemoryGraph(mind_directory=str(tmp_path))
+    mg.add_node("a")
+    mg.add_node("b")
+    mg.add_connection("a", "b")
+
+    first = mg.compute_attention_scores(current_focus="a")
+    assert mg.compute_attention_scores(current_focus="a") is first
+
+    mg.update_working_memory("b")
+    second = mg.compute_attention_scores(current_focus="a")
+    assert second is not first
+    assert second["b"] > first["b"]
+
+    mg.add_node("c")
+    assert "c" in mg.compute_attention_scores(current_focus="a")
+
+
+def test_edge_widths_use_timestamps_and_backfill_legacy_edges(tmp_path):
+    mg = MemoryGraph(mind_directory=str(tmp_path))
+    mg.add_node("a")
+    mg.add_node("b")
+    mg.add_node("c")
+    mg.add_connection("a", "b")
+    mg.graph.add_edge("a", "c", weight=1, last_updated="2000-01-01T00:00:00+00:00")
+
+    fresh, stale = mg._edge_widths(mg.graph)
+
+    assert "last_updated_ts" in mg.graph["a"]["b"]
+    assert "last_updated_ts" in mg.graph["a"]["c"]
+    assert stale == fresh * 0.5
+
+
+def test_find_exploration_target_dead_end_skips_working_memory(tmp_path):
+    mg = MemoryGraph(mind_directory=str(tmp_path))
+    mg.add_node("hub")
+    mg.add_node("isolated")
+    for leaf in ("x", "y", "z"):
+        mg.add_node(leaf)
+        mg.add_connection("hub", leaf)
+    mg.update_working_memory("hub")
+    mg.update_working_memory("isolated")
+
+    target = mg.find_exploration_target(current_focus="isolated", avoid_recent=True)
+    assert target not in ("hub", "isolated")
+    assert target in ("x", "y", "z")
+
+
+def test_understood_nodes_follow_descriptions_and_reload(tmp_path):
+    mg = MemoryGraph(mind_directory=str(tmp_path))
+    mg.add_node("a")
+    mg.add_node("b", {"description": "known concept"})
+    assert mg.understood_nodes == {"b"}
+
+    mg.add_description_to_node("a", "now known")
+    assert mg.understood_nodes == {"a", "b"}
+
+    mg.save_to_json()
+    loaded = MemoryGraph(mind_directory=str(tmp_path))
+    loaded.load_from_json()
+    assert loaded.understood_nodes == {"a", "b"}
@@ -0,0 +1,98 @@
+from emotional_system import EmotionalSystem
+from learning_tracker import LearningTracker
+from memory import MemoryGraph
+from planning_engine import PlanningEngine
+
+
+def make_planner(tmp_path):
+    mind = str(tmp_path / "mind")
+    memory = MemoryGraph(mind_directory=mind)
+    emotions = EmotionalSystem(mind_directory=mind)
+    learner = LearningTracker(mind_directory=mind)
+    return PlanningEngine(memory, emotions, learner), memory
+
+
+def test_graph_distance_tracks_graph_changes(tmp_path):
+    planner, memory = make_planner(tmp_path)
+    for node in ("a", "b", "c"):
+        memory.add_node(node)
+    memory.add_connection("a", "b")
+    memory.add_connection("b", "c")
+
+    assert planner._compute_graph_distance("missing") == 0
+    assert planner._compute_graph_distance("a") == float("inf")
+
+    memory.add_description_to_node("c", "known concept")
+    assert planner._compute_graph_distance("a") == 2
+
+    memory.add_connection("a", "c")
+    assert planner._compute_graph_distance("a") == 1
+
+
+def test_definition_validation_rejects_echoed_instructions(tmp_path):
+    planner, _ = make_planner(tmp_path)
+
+    ok, result, _ = planner._process_definition_result(
+        "memory", "direct_define", "Memory stores and retrieves past experiences for later use."
+    )
+    assert ok is True
+    assert result["definition"].startswith("Memory")
+
+    for response in (
+        "Here is YOUR TASK output for memory as requested today.",
+        "I feel disconnected from this concept right now.",
+        "too short",
+    ):
+        ok, result, _ = planner._process_definition_result("memory", "direct_define", response)
+        assert ok is False
+        assert result["error"] == "malformed_response"
+
+
+def test_select_strategy_limits_to_simpler_strategies_under_pain(tmp_path):
+    planner, memory = make_planner(tmp_path)
+    memory.add_node("a")
+    planner.emotions.state["pain"] = {"physical": 90, "existential": 90, "frustration": 90}
+
+    strategy = planner.select_strategy("a")
+
+    assert planner.strategies[strategy]["complexity"] in ("simple", "moderate")
+    goal = planner.create_goal_for_concept("a", strategy=strategy)
+    assert goal["strategy_name"] == planner.strategies[strategy]["name"]
+
+
+def test_decomposition_extracts_first_balanced_array(tmp_path):
+    planner, _ = make_planner(tmp_path)
+
+    response = 'Parts: ["a [x]", ["b", "c \\" ]"]] trailing [note]'
+    ok, result, _ = planner._process_decomposition_result("x", "top_down_decomposition", response)
+    assert ok is True
+    assert result["sub_concepts"] == ["a [x]", "b", 'c " ]']
+
+    ok, result, _ = planner._process_decomposition_result("x", "top_down_decomposition", "no array [here")
+    assert ok is False
+    assert result["error"] == "parse_failure"
+
+
+def test_execute_goal_dispatches_by_strategy(tmp_path):
+    planner, memory = make_planner(tmp_path)
+    memory.add_node("a")
+    memory.add_node("b")
+    memory.add_connection("a", "b")
+    prompts = []
+
+    def llm(task):
+        prompts.append(task)
+        if "JSON array" in task:
+            return '["part one", "part two"]'
+        return "A concept that links ideas together in a useful way."
+
+    goal = planner.create_goal_for_concept("a", strategy="contextual_synthesis")
+    ok, result, _ = planner.execute_goal(goal, llm)
+    assert ok is True and "definition" in result
+    assert "['b']" in prompts[-1]
+    assert goal["attempts"] == 1
+
+    goal = planner.create_goal_for_concept("a", strategy="top_down_decomposition")
+    ok, result, _ = planner.execute_goal(goal, llm)
+    assert ok is True
+    assert result["sub_concepts"] == ["part one", "part two"]
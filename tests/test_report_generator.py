@@ -0,0 +1,70 @@
+from report_generator import ReportGenerator
+
+
+def test_timeline_summary_feeds_both_reports():
+    timeline = [
+        {"cycle": 1, "pain": 10, "curiosity": 40, "confidence": 0.5},
+        {"cycle": 2, "pain": {"physical": 80, "frustration": 60}, "confidence": 0.2},
+        {"cycle": 3, "pain": 30, "curiosity": {"a": 60, "b": 80}, "confidence": 0.6},
+    ]
+    generator = ReportGenerator({"cycles": 3, "emotional_timeline": timeline})
+
+    summary = generator._derived.timeline_summary
+    assert summary["peak_pain_event"]["cycle"] == 2
+    assert summary["curiosity_count"] == 2
+    assert summary["curiosity_min"] == 40
+    assert summary["curiosity_max"] == 70
+    assert summary["confidence_min"] == 0.2
+    assert generator._derived.timeline_summary is summary
+
+    session = generator.generate_session_summary()
+    assert "Peak pain: 70.0 at cycle 2" in session
+    # Missing curiosity counts as zero toward the session-wide average
+    assert "Curiosity: avg 36.7" in session
+
+    dynamics = generator.generate_emotional_dynamics()
+    assert "- Average: 55.0" in dynamics
+    assert "- Range: 40.0 - 70.0" in dynamics
+    assert "- Low point: 0.20" in dynamics
+    assert "Growing confidence" in dynamics
+
+
+def test_derived_metrics_are_shared_across_reports():
+    data = {
+        "cycles": 10,
+        "concepts_learned": {
+            "a": {"success": True, "attempts": 1, "successful_strategy": "direct"},
+            "b": {"success": False, "attempts": 3, "strategies_tried": ["direct"]},
+        },
+        "strategies_used": {
+            "direct": {"attempts": 4, "successes": 1, "total_pain": 20},
+            "unused": {"attempts": 0, "successes": 0},
+        },
+        "workspace_competition": {"low": {"wins": 2}, "high": {"wins": 8}},
+    }
+    generator = ReportGenerator(data)
+
+    derived = generator._derived
+    assert generator._derived is derived
+    assert [name for name, _ in derived.failed_concepts] == ["b"]
+    assert derived.strategy_rates["direct"] == (4, 0.25, 5.0)
+    assert derived.strategy_rates["unused"] == (0, 0, 0)
+    assert derived.sorted_threads[0][0] == "high"
+
+    assert "direct most effective (25% success)" in generator.generate_session_summary()
+    assert "| direct | 4 | 25% | 5.0 | ⭐ |" in generator.generate_learning_analysis()
+
+
+def test_generate_all_reports_writes_utf8_files(tmp_path):
+    data = {"cycles": 2, "workspace_competition": {"thread": {"wins": 2}}}
+    output_dir = tmp_path / "reports" / "session"
+
+    saved = ReportGenerator(data).generate_all_reports(output_dir)
+
+    assert [p.name for p in saved] == [
+        "session_summary.md",
+        "learning_analysis.md",
+        "consciousness_patterns.md",
+        "emotional_dynamics.md",
+    ]
+    assert "█" in (output_dir / "consciousness_patterns.md").read_text(encoding="utf-8")
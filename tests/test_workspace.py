@@ -1,3 +1,5 @@
+import pytest
+
 from gnw_types import Proposal
 from workspace import Workspace
 
@@ -84,3 +86,118 @@ def test_attention_gain_controls_ignition_threshold():
     content = ws.cycle()
     assert content is not None
     assert content.ignited is True
+
+
+def test_matching_payloads_aggregate_regardless_of_key_order():
+    first = Proposal(
+        source="A",
+        content={"type": "explore", "payload": {"target_concept": "x", "path": ["a", "b"]}},
+        evidence=0.4,
+        salience=0.5,
+        novelty=0.5,
+        urgency=0.5,
+    )
+    second = Proposal(
+        source="B",
+        content={"type": "explore", "payload": {"path": ["a", "b"], "target_concept": "x"}},
+        evidence=0.4,
+        salience=0.5,
+        novelty=0.5,
+        urgency=0.5,
+    )
+    other = Proposal(
+        source="C",
+        content={"type": "explore", "payload": {"target_concept": "y"}},
+        evidence=0.4,
+        salience=0.5,
+        novelty=0.5,
+        urgency=0.5,
+    )
+    ws = Workspace([StaticModule([first, second, other])], noise=0.0)
+
+    aggregated = ws._aggregate_proposals(ws._collect_proposals())
+
+    assert len(aggregated) == 2
+    assert aggregated[0].sources == ["A", "B"]
+    assert aggregated[0].evidence == 0.8
+
+
+def test_focus_bonus_and_repetition_penalty():
+    def make(concept):
+        return Proposal(
+            source="Test",
+            content={"type": "explore", "payload": {"target_concept": concept}},
+            evidence=0.5,
+            salience=0.5,
+            novelty=0.5,
+            urgency=0.5,
+        )
+
+    ws = Workspace([], noise=0.0)
+    ws.update_context(
+        attention_gain=1.0,
+        current_focus="focus",
+        recent_actions=[
+            {"type": "explore", "concept": "old"},
+            {"type": "explore", "concept": "stale"},
+            {"type": "explore", "concept": "a"},
+            {"type": "explore", "concept": "b"},
+        ],
+    )
+
+    focused, repeated, stale, plain = ws._score_proposals(
+        [make("focus"), make("b"), make("old"), make("fresh")]
+    )
+
+    assert focused.score == pytest.approx(plain.score + 0.1)
+    assert repeated.score == pytest.approx(plain.score - 0.1)
+    # Only the last three actions count as repetition
+    assert stale.score == plain.score
+
+
+def test_single_proposal_skips_aggregation_but_matches_its_result():
+    proposal = Proposal(
+        source="Test",
+        content={"type": "percept", "payload": {"concept": "x"}},
+        evidence=1.4,
+        salience=0.6,
+        novelty=0.5,
+        urgency=0.5,
+        sources=["stale"],
+    )
+    expected = Workspace([], noise=0.0)._aggregate_proposals([proposal])[0]
+    ws = Workspace([StaticModule([proposal])], ignition_threshold=2.0, noise=0.0)
+    ws.update_context(attention_gain=1.0)
+
+    assert ws.cycle() is None
+    (scored,) = ws.last_proposals
+    assert scored.sources == expected.sources == ["Test"]
+    assert scored.evidence == expected.evidence == 1.0
+
+
+def test_history_keeps_only_the_most_recent_ignitions():
+    proposal = Proposal(
+        source="Test",
+        content={"type": "reflect", "payload": {}},
+        evidence=1.0,
+        salience=1.0,
+        novelty=1.0,
+        urgency=1.0,
+    )
+    ws = Workspace([StaticModule([proposal])], ignition_threshold=0.5, noise=0.0, history_limit=3)
+    ws.update_context(attention_gain=1.0)
+
+    ignitions = [ws.cycle() for _ in range(5)]
+
+    assert list(ws.state.history) == ignitions[-3:]
+
+
+def test_content_key_keeps_json_distinct_payloads_apart():
+    ws = Workspace([], noise=0.0)
+
+    def key(payload):
+        return ws._content_key({"type": "percept", "payload": payload})
+
+    assert key({"a": 1}) != key([["a", 1]])
+    assert len({key({"x": True}), key({"x": 1}), key({"x": 1.0}), key({"x": "1"})}) == 4
+    assert key({"a": 1, "b": [1, 2]}) == key({"b": [1, 2], "a": 1})
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 import random
 import time
+from collections import deque
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from gnw_types import Proposal, WorkspaceContent, WorkspaceState, Module
@@ -10,11 +10,27 @@ from log import setup_logger
 
 logger = setup_logger()
 
+_random = random.random
+
 
 def _clamp(value: float, min_value: float, max_value: float) -> float:
     return max(min_value, min(max_value, value))
 
 
+def _canonical(obj: Any) -> Any:
+    """Hashable, key-order independent form of a JSON-like payload.
+
+    Containers and scalars carry a tag so that payloads json.dumps would
+    render differently stay distinct: a dict never equals a list of pairs,
+    and True, 1 and 1.0 (equal and equally hashed in Python) do not merge.
+    """
+    if isinstance(obj, dict):
+        return ("__dict__", tuple(sorted((key, _canonical(value)) for key, value in obj.items())))
+    if isinstance(obj, (list, tuple)):
+        return ("__list__", tuple(_canonical(value) for value in obj))
+    return (type(obj), obj)
+
+
 class Workspace:
     def __init__(
         self,
@@ -42,7 +58,8 @@ class Workspace:
         self.history_limit = history_limit
 
         self.context: Dict[str, Any] = {}
-        self.state = WorkspaceState()
+        # Bounded history: appends evict the oldest entry in O(1)
+        self.state = WorkspaceState(history=deque(maxlen=history_limit))
         self.last_proposals: List[Proposal] = []
         self.last_winner_proposal: Optional[Proposal] = None
 
@@ -56,8 +73,16 @@ class Workspace:
             module.tick(self.context)
 
         proposals = self._collect_proposals()
-        aggregated = self._aggregate_proposals(proposals)
-        scored = self._score_proposals(aggregated)
+        if len(proposals) > 1:
+            scored = self._score_proposals(self._aggregate_proposals(proposals))
+        elif proposals:
+            # A lone proposal has nothing to merge with; skip the bucketing pass
+            single = proposals[0]
+            single.sources = [single.source]
+            single.evidence = _clamp(single.evidence, 0.0, 1.0)
+            scored = self._score_proposals(proposals)
+        else:
+            scored = proposals
         self.last_proposals = scored
 
         if scored:
@@ -87,7 +112,7 @@ class Workspace:
         return proposals
 
     def _aggregate_proposals(self, proposals: Iterable[Proposal]) -> List[Proposal]:
-        buckets: Dict[Tuple[str, str], List[Proposal]] = {}
+        buckets: Dict[Tuple[str, Any], List[Proposal]] = {}
         for proposal in proposals:
             key = self._content_key(proposal.content)
             buckets.setdefault(key, []).append(proposal)
@@ -115,26 +140,42 @@ class Workspace:
         return aggregated
 
     def _score_proposals(self, proposals: List[Proposal]) -> List[Proposal]:
+        # Everything below is constant for the cycle; hoist it out of the loop
         attention_gain = _clamp(self.context.get("attention_gain", 1.0), 0.5, 1.5)
         current_focus = self.context.get("current_focus")
+        recent_tail = tuple(
+            (action.get("type"), action.get("concept"))
+            for action in self.context.get("recent_actions", [])[-3:]
+        )
+        weights = self.weights
+        w_evidence = weights["evidence"]
+        w_salience = weights["salience"]
+        w_novelty = weights["novelty"]
+        w_urgency = weights["urgency"]
+        noise_span = 2.0 * self.noise
 
         for proposal in proposals:
             base_score = (
-                self.weights["evidence"] * proposal.evidence
-                + self.weights["salience"] * proposal.salience
-                + self.weights["novelty"] * proposal.novelty
-                + self.weights["urgency"] * proposal.urgency
+                w_evidence * proposal.evidence
+                + w_salience * proposal.salience
+                + w_novelty * proposal.novelty
+                + w_urgency * proposal.urgency
             )
 
+            content = proposal.content
+            payload = content.get("payload", {})
+            concept = payload.get("concept")
+            target_concept = payload.get("target_concept")
+
             focus_bonus = 0.0
-            if current_focus and self._content_mentions_focus(proposal.content, current_focus):
+            if current_focus and (concept == current_focus or target_concept == current_focus):
                 focus_bonus = 0.1
 
             repetition_penalty = 0.0
-            if self._content_repeats(proposal.content, self.context.get("recent_actions", [])):
+            if recent_tail and (content.get("type"), concept or target_concept) in recent_tail:
                 repetition_penalty = 0.1
 
-            noise = random.uniform(-self.noise, self.noise)
+            noise = (_random() - 0.5) * noise_span if noise_span else 0.0
             proposal.score = _clamp(
                 (base_score + focus_bonus - repetition_penalty + noise) * attention_gain,
                 0.0,
@@ -142,7 +183,7 @@ class Workspace:
             )
 
             logger.info(
-                f"  [{proposal.source}] {proposal.content.get('type')} score={proposal.score:.3f}"
+                f"  [{proposal.source}] {content.get('type')} score={proposal.score:.3f}"
             )
 
         return proposals
@@ -159,8 +200,6 @@ class Workspace:
         )
         self.state.current = content
         self.state.history.append(content)
-        if len(self.state.history) > self.history_limit:
-            self.state.history = self.state.history[-self.history_limit :]
 
         logger.info(
             f">>> IGNITION: {content.type} activation={content.activation:.3f} sources={content.sources}"
@@ -188,25 +227,6 @@ class Workspace:
         for module in self.modules:
             module.on_broadcast(content, self.context)
 
-    def _content_key(self, content: Dict[str, Any]) -> Tuple[str, str]:
-        payload = content.get("payload", {})
-        payload_key = json.dumps(payload, sort_keys=True)
-        return content.get("type", "unknown"), payload_key
-
-    def _content_mentions_focus(self, content: Dict[str, Any], focus: str) -> bool:
-        payload = content.get("payload", {})
-        for key in ("concept", "target_concept"):
-            if payload.get(key) == focus:
-                return True
-        return False
-
-    def _content_repeats(self, content: Dict[str, Any], recent_actions: List[Dict[str, Any]]) -> bool:
-        if not recent_actions:
-            return False
-        content_type = content.get("type")
+    def _content_key(self, content: Dict[str, Any]) -> Tuple[str, Any]:
         payload = content.get("payload", {})
-        concept = payload.get("concept") or payload.get("target_concept")
-        for action in recent_actions[-3:]:
-            if action.get("type") == content_type and action.get("concept") == concept:
-                return True
-        return False
+        return content.get("type", "unknown"), _canonical(payload)